@@ -12,14 +12,17 @@ def make_asgi_app(registry: CollectorRegistry = REGISTRY, disable_compression: b
         assert scope.get("type") == "http"
         # Prepare parameters
         params = parse_qs(scope.get('query_string', b''))
-        accept_header = ",".join([
-            value.decode("utf8") for (name, value) in scope.get('headers')
-            if name.decode("utf8").lower() == 'accept'
-        ])
-        accept_encoding_header = ",".join([
-            value.decode("utf8") for (name, value) in scope.get('headers')
-            if name.decode("utf8").lower() == 'accept-encoding'
-        ])
+        accept = []
+        accept_encoding = []
+        # Only the two headers used here need decoding.
+        for name, value in scope.get('headers'):
+            name = name.lower()
+            if name == b'accept':
+                accept.append(value.decode("utf8"))
+            elif name == b'accept-encoding':
+                accept_encoding.append(value.decode("utf8"))
+        accept_header = ",".join(accept)
+        accept_encoding_header = ",".join(accept_encoding)
         # Bake output
         status, headers, output = _bake_output(registry, accept_header, accept_encoding_header, params, disable_compression)
         formatted_headers = []
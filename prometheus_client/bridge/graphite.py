@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+import functools
 import logging
 import re
 import socket
@@ -16,6 +17,9 @@ from ..registry import CollectorRegistry, REGISTRY
 _INVALID_GRAPHITE_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
 
 
+# Names and label values repeat from push to push, and across the samples
+# of a metric, so avoid running the regex on them every time.
+@functools.lru_cache(maxsize=4096)
 def _sanitize(s):
     return _INVALID_GRAPHITE_CHARS.sub('_', s)
 
@@ -61,32 +65,34 @@ class GraphiteBridge:
 
     def push(self, prefix: str = '') -> None:
         now = int(self._timer())
-        output = []
 
         prefixstr = ''
         if prefix:
             prefixstr = prefix + '.'
 
-        for metric in self._registry.collect():
-            for s in metric.samples:
-                if s.labels:
-                    if self._tags:
-                        sep = ';'
-                        fmt = '{0}={1}'
-                    else:
-                        sep = '.'
-                        fmt = '{0}.{1}'
-                    labelstr = sep + sep.join(
-                        [fmt.format(
-                            _sanitize(k), _sanitize(v))
-                            for k, v in sorted(s.labels.items())])
-                else:
-                    labelstr = ''
-                output.append(f'{prefixstr}{_sanitize(s.name)}{labelstr} {float(s.value)} {now}\n')
-
-        conn = socket.create_connection(self._address, self._timeout)
-        conn.sendall(''.join(output).encode('ascii'))
-        conn.close()
+        if self._tags:
+            sep = ';'
+            fmt = '{0}={1}'
+        else:
+            sep = '.'
+            fmt = '{0}.{1}'
+
+        with socket.create_connection(self._address, self._timeout) as conn:
+            # Send each metric's lines as they are produced, rather than
+            # holding the whole registry's output in memory.
+            with conn.makefile('wb') as out:
+                for metric in self._registry.collect():
+                    output = []
+                    for s in metric.samples:
+                        if s.labels:
+                            labelstr = sep + sep.join(
+                                [fmt.format(
+                                    _sanitize(k), _sanitize(v))
+                                    for k, v in sorted(s.labels.items())])
+                        else:
+                            labelstr = ''
+                        output.append(f'{prefixstr}{_sanitize(s.name)}{labelstr} {float(s.value)} {now}\n')
+                    out.write(''.join(output).encode('ascii'))
 
     def start(self, interval: float = 60.0, prefix: str = '') -> None:
         t = _RegularPush(self, interval, prefix)
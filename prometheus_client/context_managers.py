@@ -1,4 +1,4 @@
-from timeit import default_timer
+from time import perf_counter
 from types import TracebackType
 from typing import (
     Any, Callable, Literal, Optional, Tuple, Type, TYPE_CHECKING, TypeVar,
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 
 class ExceptionCounter:
+    __slots__ = ('_counter', '_exception')
+
     def __init__(self, counter: "Counter", exception: Union[Type[BaseException], Tuple[Type[BaseException], ...]]) -> None:
         self._counter = counter
         self._exception = exception
@@ -26,14 +28,21 @@ class ExceptionCounter:
         return False
 
     def __call__(self, f: "F") -> "F":
+        # Same as `with self:`, written out to skip the context manager
+        # protocol on every call of the decorated function.
         def wrapped(func, *args, **kwargs):
-            with self:
+            try:
                 return func(*args, **kwargs)
+            except self._exception:
+                self._counter.inc()
+                raise
 
         return decorate(f, wrapped)
 
 
 class InprogressTracker:
+    __slots__ = ('_gauge',)
+
     def __init__(self, gauge):
         self._gauge = gauge
 
@@ -45,27 +54,30 @@ class InprogressTracker:
 
     def __call__(self, f: "F") -> "F":
         def wrapped(func, *args, **kwargs):
-            with self:
+            self._gauge.inc()
+            try:
                 return func(*args, **kwargs)
+            finally:
+                self._gauge.dec()
 
         return decorate(f, wrapped)
 
 
 class Timer:
+    # One is created per timed call, so keep them small.
+    __slots__ = ('_metric', '_callback_name', '_start')
+
     def __init__(self, metric, callback_name):
         self._metric = metric
         self._callback_name = callback_name
 
-    def _new_timer(self):
-        return self.__class__(self._metric, self._callback_name)
-
     def __enter__(self):
-        self._start = default_timer()
+        self._start = perf_counter()
         return self
 
     def __exit__(self, typ, value, traceback):
-        # Time can go backwards.
-        duration = max(default_timer() - self._start, 0)
+        # perf_counter is monotonic, so the duration can't be negative.
+        duration = perf_counter() - self._start
         callback = getattr(self._metric, self._callback_name)
         callback(duration)
 
@@ -74,9 +86,13 @@ class Timer:
 
     def __call__(self, f: "F") -> "F":
         def wrapped(func, *args, **kwargs):
-            # Obtaining new instance of timer every time
-            # ensures thread safety and reentrancy.
-            with self._new_timer():
+            # Keep the metric and start time local rather than on self,
+            # which ensures thread safety and reentrancy.
+            metric = self._metric
+            start = perf_counter()
+            try:
                 return func(*args, **kwargs)
+            finally:
+                getattr(metric, self._callback_name)(perf_counter() - start)
 
         return decorate(f, wrapped)
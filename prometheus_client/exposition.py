@@ -1,5 +1,6 @@
 import base64
 from contextlib import closing
+import functools
 import gzip
 from http.server import BaseHTTPRequestHandler
 import os
@@ -8,7 +9,9 @@ from socketserver import ThreadingMixIn
 import ssl
 import sys
 import threading
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union,
+)
 from urllib.error import HTTPError
 from urllib.parse import parse_qs, quote_plus, urlparse
 from urllib.request import (
@@ -245,22 +248,51 @@ def start_wsgi_server(
 start_http_server = start_wsgi_server
 
 
-def generate_latest(registry: CollectorRegistry = REGISTRY) -> bytes:
-    """Returns the metrics from the registry in latest text format as a string."""
+@functools.lru_cache(maxsize=4096)
+def _help_and_type(name: str, documentation: str, typ: str) -> bytes:
+    """Returns the encoded HELP and TYPE lines for a metric family.
+
+    These only depend on the name, documentation and type, which don't
+    change between scrapes, so the result is cached."""
+    name = openmetrics.escape_metric_name(name)
+    documentation = documentation.replace('\\', r'\\').replace('\n', r'\n')
+    return f'# HELP {name} {documentation}\n# TYPE {name} {typ}\n'.encode('utf-8')
+
+
+@functools.lru_cache(maxsize=4096)
+def _escape_label_name(name: str) -> str:
+    """Returns the label name as it should appear in the output.
+
+    A family has few label names but repeats them on every sample, and
+    checking whether a name needs quoting takes two regex matches."""
+    return openmetrics.escape_label_name(name)
+
+
+# Sample names repeat within a family, e.g. on every bucket of a histogram.
+_is_valid_sample_name = functools.lru_cache(maxsize=4096)(_is_valid_legacy_metric_name)
+
+
+def _iter_latest(registry: CollectorRegistry) -> Iterator[bytes]:
+    """Yields the metrics from the registry in latest text format, one encoded
+    metric family at a time.
+
+    The text format has no end marker, so a response cut short by a failing
+    collector would look complete to the scraper. HTTP handlers therefore
+    still send the whole output from generate_latest; this is only streamed
+    where a failure discards what was written, as in write_to_textfile."""
 
     def sample_line(samples):
         if samples.labels:
-            labelstr = '{0}'.format(','.join(
-                ['{}="{}"'.format(
-                    openmetrics.escape_label_name(k), openmetrics._escape(v))
-                    for k, v in sorted(samples.labels.items())]))
+            labelstr = ','.join([
+                f'{_escape_label_name(k)}="{openmetrics._escape(v)}"'
+                for k, v in sorted(samples.labels.items())])
         else:
             labelstr = ''
         timestamp = ''
         if samples.timestamp is not None:
             # Convert to milliseconds.
             timestamp = f' {int(float(samples.timestamp) * 1000):d}'
-        if _is_valid_legacy_metric_name(samples.name):
+        if _is_valid_sample_name(samples.name):
             if labelstr:
                 labelstr = '{{{0}}}'.format(labelstr)
             return f'{samples.name}{labelstr} {floatToGoString(samples.value)}{timestamp}\n'
@@ -269,8 +301,10 @@ def generate_latest(registry: CollectorRegistry = REGISTRY) -> bytes:
             maybe_comma = ','
         return f'{{{openmetrics.escape_metric_name(samples.name)}{maybe_comma}{labelstr}}} {floatToGoString(samples.value)}{timestamp}\n'
 
-    output = []
     for metric in registry.collect():
+        # Encode each line straight into a growable buffer rather than
+        # keeping every fragment alive until a final join.
+        output = bytearray()
         try:
             mname = metric.name
             mtype = metric.type
@@ -289,29 +323,31 @@ def generate_latest(registry: CollectorRegistry = REGISTRY) -> bytes:
             elif mtype == 'unknown':
                 mtype = 'untyped'
 
-            output.append('# HELP {} {}\n'.format(
-                openmetrics.escape_metric_name(mname), metric.documentation.replace('\\', r'\\').replace('\n', r'\n')))
-            output.append(f'# TYPE {openmetrics.escape_metric_name(mname)} {mtype}\n')
+            output += _help_and_type(mname, metric.documentation, mtype)
 
             om_samples: Dict[str, List[str]] = {}
+            # Build the names once per family, not for every sample.
+            om_suffixes = {metric.name + suffix: suffix for suffix in ('_created', '_gsum', '_gcount')}
             for s in metric.samples:
-                for suffix in ['_created', '_gsum', '_gcount']:
-                    if s.name == metric.name + suffix:
-                        # OpenMetrics specific sample, put in a gauge at the end.
-                        om_samples.setdefault(suffix, []).append(sample_line(s))
-                        break
+                suffix = om_suffixes.get(s.name)
+                if suffix is not None:
+                    # OpenMetrics specific sample, put in a gauge at the end.
+                    om_samples.setdefault(suffix, []).append(sample_line(s))
                 else:
-                    output.append(sample_line(s))
+                    output += sample_line(s).encode('utf-8')
         except Exception as exception:
             exception.args = (exception.args or ('',)) + (metric,)
             raise
 
         for suffix, lines in sorted(om_samples.items()):
-            output.append('# HELP {} {}\n'.format(openmetrics.escape_metric_name(metric.name + suffix),
-                                                  metric.documentation.replace('\\', r'\\').replace('\n', r'\n')))
-            output.append(f'# TYPE {openmetrics.escape_metric_name(metric.name + suffix)} gauge\n')
-            output.extend(lines)
-    return ''.join(output).encode('utf-8')
+            output += _help_and_type(metric.name + suffix, metric.documentation, 'gauge')
+            output += ''.join(lines).encode('utf-8')
+        yield output
+
+
+def generate_latest(registry: CollectorRegistry = REGISTRY) -> bytes:
+    """Returns the metrics from the registry in latest text format as a string."""
+    return b''.join(_iter_latest(registry))
 
 
 def choose_encoder(accept_header: str) -> Tuple[Callable[[CollectorRegistry], bytes], str]:
@@ -377,7 +413,7 @@ def write_to_textfile(path: str, registry: CollectorRegistry) -> None:
     tmppath = f'{path}.{os.getpid()}.{threading.current_thread().ident}'
     try:
         with open(tmppath, 'wb') as f:
-            f.write(generate_latest(registry))
+            f.writelines(_iter_latest(registry))
 
         # rename(2) is atomic but fails on Windows if the destination file exists
         if os.name == 'nt':
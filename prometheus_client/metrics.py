@@ -1,3 +1,4 @@
+from bisect import bisect_left
 import os
 from threading import Lock
 import time
@@ -74,7 +75,7 @@ class MetricWrapperBase(Collector):
         # Functions that mutate the state of the metric, for example incrementing
         # a counter, will fail if the metric is not observable, because only if a
         # metric is observable will the value be initialized.
-        if not self._is_observable():
+        if not self._observable:
             raise ValueError('%s metric is missing label values' % str(self._type))
 
     def _is_parent(self):
@@ -122,8 +123,17 @@ class MetricWrapperBase(Collector):
             # Prepare the fields needed for child metrics.
             self._lock = Lock()
             self._metrics: Dict[Sequence[str], T] = {}
-
-        if self._is_observable():
+            # Compared against the keys of labels(**kwargs) on every call.
+            self._labelname_set = frozenset(self._labelnames)
+        elif self._labelvalues:
+            # A child's labels never change, so build them once here rather
+            # than on every scrape in the parent's _multi_samples().
+            self._series_labels = dict(zip(self._labelnames, self._labelvalues))
+
+        # The labels are fixed from here on, so work this out once rather
+        # than on every update.
+        self._observable = bool(self._is_observable())
+        if self._observable:
             self._metric_init()
 
         if not self._labelvalues:
@@ -167,24 +177,31 @@ class MetricWrapperBase(Collector):
             raise ValueError("Can't pass both *args and **kwargs")
 
         if labelkwargs:
-            if sorted(labelkwargs) != sorted(self._labelnames):
+            # The length check also rejects kwargs for a metric with
+            # duplicate label names, which the set comparison can't see.
+            if len(labelkwargs) != len(self._labelnames) or labelkwargs.keys() != self._labelname_set:
                 raise ValueError('Incorrect label names')
             labelvalues = tuple(str(labelkwargs[l]) for l in self._labelnames)
         else:
             if len(labelvalues) != len(self._labelnames):
                 raise ValueError('Incorrect label count')
             labelvalues = tuple(str(l) for l in labelvalues)
-        with self._lock:
-            if labelvalues not in self._metrics:
-                self._metrics[labelvalues] = self.__class__(
-                    self._name,
-                    documentation=self._documentation,
-                    labelnames=self._labelnames,
-                    unit=self._unit,
-                    _labelvalues=labelvalues,
-                    **self._kwargs
-                )
-            return self._metrics[labelvalues]
+        # The child usually exists already, and a dict lookup is atomic, so
+        # only take the lock when it has to be created.
+        metric = self._metrics.get(labelvalues)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(labelvalues)
+                if metric is None:
+                    metric = self._metrics[labelvalues] = self.__class__(
+                        self._name,
+                        documentation=self._documentation,
+                        labelnames=self._labelnames,
+                        unit=self._unit,
+                        _labelvalues=labelvalues,
+                        **self._kwargs
+                    )
+        return metric
 
     def remove(self, *labelvalues: Any) -> None:
         if 'prometheus_multiproc_dir' in os.environ or 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
@@ -199,9 +216,10 @@ class MetricWrapperBase(Collector):
         if len(labelvalues) != len(self._labelnames):
             raise ValueError('Incorrect label count (expected %d, got %s)' % (len(self._labelnames), labelvalues))
         labelvalues = tuple(str(l) for l in labelvalues)
-        with self._lock:
-            if labelvalues in self._metrics:
-                del self._metrics[labelvalues]
+        # As in labels(), only take the lock when there is something to do.
+        if labelvalues in self._metrics:
+            with self._lock:
+                self._metrics.pop(labelvalues, None)
 
     def clear(self) -> None:
         """Remove all labelsets from the metric"""
@@ -221,10 +239,10 @@ class MetricWrapperBase(Collector):
     def _multi_samples(self) -> Iterable[Sample]:
         with self._lock:
             metrics = self._metrics.copy()
-        for labels, metric in metrics.items():
-            series_labels = list(zip(self._labelnames, labels))
+        for metric in metrics.values():
+            series_labels = metric._series_labels
             for suffix, sample_labels, value, timestamp, exemplar, native_histogram_value in metric._samples():
-                yield Sample(suffix, dict(series_labels + list(sample_labels.items())), value, timestamp, exemplar, native_histogram_value)
+                yield Sample(suffix, {**series_labels, **sample_labels}, value, timestamp, exemplar, native_histogram_value)
 
     def _child_samples(self) -> Iterable[Sample]:  # pragma: no cover
         raise NotImplementedError('_child_samples() must be implemented by %r' % self)
@@ -514,13 +532,10 @@ class Summary(MetricWrapperBase):
         return Timer(self, 'observe')
 
     def _child_samples(self) -> Iterable[Sample]:
-        samples = [
-            Sample('_count', {}, self._count.get(), None, None),
-            Sample('_sum', {}, self._sum.get(), None, None),
-        ]
+        yield Sample('_count', {}, self._count.get(), None, None)
+        yield Sample('_sum', {}, self._sum.get(), None, None)
         if _use_created:
-            samples.append(Sample('_created', {}, self._created, None, None))
-        return tuple(samples)
+            yield Sample('_created', {}, self._created, None, None)
 
 
 class Histogram(MetricWrapperBase):
@@ -603,13 +618,15 @@ class Histogram(MetricWrapperBase):
         self._created = time.time()
         bucket_labelnames = self._labelnames + ('le',)
         self._sum = values.ValueClass(self._type, self._name, self._name + '_sum', self._labelnames, self._labelvalues, self._documentation)
-        for b in self._upper_bounds:
+        # The bounds never change, so format them once rather than on every scrape.
+        self._bucket_les = [floatToGoString(b) for b in self._upper_bounds]
+        for le in self._bucket_les:
             self._buckets.append(values.ValueClass(
                 self._type,
                 self._name,
                 self._name + '_bucket',
                 bucket_labelnames,
-                self._labelvalues + (floatToGoString(b),),
+                self._labelvalues + (le,),
                 self._documentation)
             )
 
@@ -625,13 +642,35 @@ class Histogram(MetricWrapperBase):
         """
         self._raise_if_not_observable()
         self._sum.inc(amount)
-        for i, bound in enumerate(self._upper_bounds):
-            if amount <= bound:
-                self._buckets[i].inc(1)
-                if exemplar:
-                    _validate_exemplar(exemplar)
-                    self._buckets[i].set_exemplar(Exemplar(exemplar, amount, time.time()))
-                break
+        # Index of the first bucket with amount <= bound. The last bound is
+        # +Inf, so this is always in range; only NaN fails the check below.
+        i = bisect_left(self._upper_bounds, amount)
+        if amount <= self._upper_bounds[i]:
+            self._buckets[i].inc(1)
+            if exemplar:
+                _validate_exemplar(exemplar)
+                self._buckets[i].set_exemplar(Exemplar(exemplar, amount, time.time()))
+
+    def observe_many(self, amounts: Iterable[float]) -> None:
+        """Observe each of the given amounts.
+
+        Equivalent to calling observe() for every amount, but the sum and
+        each affected bucket are only updated once, which is cheaper when
+        recording a batch of pre-collected values.
+        """
+        self._raise_if_not_observable()
+        upper_bounds = self._upper_bounds
+        counts = [0] * len(upper_bounds)
+        total = 0.0
+        for amount in amounts:
+            total += amount
+            i = bisect_left(upper_bounds, amount)
+            if amount <= upper_bounds[i]:
+                counts[i] += 1
+        self._sum.inc(total)
+        for bucket, count in zip(self._buckets, counts):
+            if count:
+                bucket.inc(count)
 
     def time(self) -> Timer:
         """Time a block of code or function, and observe the duration in seconds.
@@ -641,17 +680,15 @@ class Histogram(MetricWrapperBase):
         return Timer(self, 'observe')
 
     def _child_samples(self) -> Iterable[Sample]:
-        samples = []
         acc = 0.0
-        for i, bound in enumerate(self._upper_bounds):
-            acc += self._buckets[i].get()
-            samples.append(Sample('_bucket', {'le': floatToGoString(bound)}, acc, None, self._buckets[i].get_exemplar()))
-        samples.append(Sample('_count', {}, acc, None, None))
+        for le, bucket in zip(self._bucket_les, self._buckets):
+            acc += bucket.get()
+            yield Sample('_bucket', {'le': le}, acc, None, bucket.get_exemplar())
+        yield Sample('_count', {}, acc, None, None)
         if self._upper_bounds[0] >= 0:
-            samples.append(Sample('_sum', {}, self._sum.get(), None, None))
+            yield Sample('_sum', {}, self._sum.get(), None, None)
         if _use_created:
-            samples.append(Sample('_created', {}, self._created, None, None))
-        return tuple(samples)
+            yield Sample('_created', {}, self._created, None, None)
 
 
 class Info(MetricWrapperBase):
@@ -140,9 +140,12 @@ class CounterMetricFamily(Metric):
           value: The value of the metric
           created: Optional unix timestamp the child was created at.
         """
-        self.samples.append(Sample(self.name + '_total', dict(zip(self._labelnames, labels)), value, timestamp, exemplar))
+        label_dict = dict(zip(self._labelnames, labels))
         if created is not None:
-            self.samples.append(Sample(self.name + '_created', dict(zip(self._labelnames, labels)), created, timestamp))
+            self.samples.append(Sample(self.name + '_total', label_dict.copy(), value, timestamp, exemplar))
+            self.samples.append(Sample(self.name + '_created', label_dict, created, timestamp))
+        else:
+            self.samples.append(Sample(self.name + '_total', label_dict, value, timestamp, exemplar))
 
 
 class GaugeMetricFamily(Metric):
@@ -217,8 +220,9 @@ class SummaryMetricFamily(Metric):
           count_value: The count value of the metric.
           sum_value: The sum value of the metric.
         """
-        self.samples.append(Sample(self.name + '_count', dict(zip(self._labelnames, labels)), count_value, timestamp))
-        self.samples.append(Sample(self.name + '_sum', dict(zip(self._labelnames, labels)), sum_value, timestamp))
+        label_dict = dict(zip(self._labelnames, labels))
+        self.samples.append(Sample(self.name + '_count', label_dict.copy(), count_value, timestamp))
+        self.samples.append(Sample(self.name + '_sum', label_dict, sum_value, timestamp))
 
 
 class HistogramMetricFamily(Metric):
@@ -261,14 +265,17 @@ class HistogramMetricFamily(Metric):
               The buckets must be sorted, and +Inf present.
           sum_value: The sum value of the metric.
         """
+        # Each sample gets its own copy of the labels, built from this one.
+        label_dict = dict(zip(self._labelnames, labels))
+        bucket_name = self.name + '_bucket'
         for b in buckets:
             bucket, value = b[:2]
             exemplar = None
             if len(b) == 3:
                 exemplar = b[2]  # type: ignore
             self.samples.append(Sample(
-                self.name + '_bucket',
-                dict(list(zip(self._labelnames, labels)) + [('le', bucket)]),
+                bucket_name,
+                {**label_dict, 'le': bucket},
                 value,
                 timestamp,
                 exemplar,
@@ -277,9 +284,9 @@ class HistogramMetricFamily(Metric):
         if float(buckets[0][0]) >= 0 and sum_value is not None:
             # +Inf is last and provides the count value.
             self.samples.append(
-                Sample(self.name + '_count', dict(zip(self._labelnames, labels)), buckets[-1][1], timestamp))
+                Sample(self.name + '_count', label_dict.copy(), buckets[-1][1], timestamp))
             self.samples.append(
-                Sample(self.name + '_sum', dict(zip(self._labelnames, labels)), sum_value, timestamp))
+                Sample(self.name + '_sum', label_dict, sum_value, timestamp))
 
 
 class GaugeHistogramMetricFamily(Metric):
@@ -319,16 +326,18 @@ class GaugeHistogramMetricFamily(Metric):
               The buckets must be sorted, and +Inf present.
           gsum_value: The sum value of the metric.
         """
+        label_dict = dict(zip(self._labelnames, labels))
+        bucket_name = self.name + '_bucket'
         for bucket, value in buckets:
             self.samples.append(Sample(
-                self.name + '_bucket',
-                dict(list(zip(self._labelnames, labels)) + [('le', bucket)]),
+                bucket_name,
+                {**label_dict, 'le': bucket},
                 value, timestamp))
         # +Inf is last and provides the count value.
         self.samples.extend([
-            Sample(self.name + '_gcount', dict(zip(self._labelnames, labels)), buckets[-1][1], timestamp),
+            Sample(self.name + '_gcount', label_dict.copy(), buckets[-1][1], timestamp),
             # TODO: Handle None gsum_value correctly. Currently a None will fail exposition but is allowed here.
-            Sample(self.name + '_gsum', dict(zip(self._labelnames, labels)), gsum_value, timestamp),  # type: ignore
+            Sample(self.name + '_gsum', label_dict, gsum_value, timestamp),  # type: ignore
         ])
 
 
@@ -2,13 +2,15 @@ import json
 import mmap
 import os
 import struct
-from typing import List
+from typing import Dict, List
 
 _INITIAL_MMAP_SIZE = 1 << 16
 _pack_integer_func = struct.Struct(b'i').pack
 _pack_two_doubles_func = struct.Struct(b'dd').pack
 _unpack_integer = struct.Struct(b'i').unpack_from
 _unpack_two_doubles = struct.Struct(b'dd').unpack_from
+# Entry layouts by padded key length, so the format is only compiled once.
+_entry_structs: Dict[int, struct.Struct] = {}
 
 
 # struct.pack_into has atomicity issues because it will temporarily write 0 into
@@ -97,18 +99,35 @@ class MmapedDict:
         encoded = key.encode('utf-8')
         # Pad to be 8-byte aligned.
         padded = encoded + (b' ' * (8 - (len(encoded) + 4) % 8))
-        value = struct.pack(f'i{len(padded)}sdd'.encode(), len(encoded), padded, 0.0, 0.0)
-        while self._used + len(value) > self._capacity:
-            self._capacity *= 2
-            self._f.truncate(self._capacity)
-            self._m = mmap.mmap(self._f.fileno(), self._capacity)
-        self._m[self._used:self._used + len(value)] = value
+        entry = _entry_structs.get(len(padded))
+        if entry is None:
+            entry = _entry_structs[len(padded)] = struct.Struct(f'i{len(padded)}sdd'.encode())
+        if self._used + entry.size > self._capacity:
+            capacity = self._capacity
+            while self._used + entry.size > capacity:
+                capacity *= 2
+            self._grow(capacity)
+        # Readers stop at the used offset, which is only moved past the
+        # new entry below, so it's safe to pack straight into the mmap.
+        entry.pack_into(self._m, self._used, len(encoded), padded, 0.0, 0.0)
 
         # Update how much space we've used.
-        self._used += len(value)
+        self._used += entry.size
         _pack_integer(self._m, 0, self._used)
         self._positions[key] = self._used - 16
 
+    def _grow(self, capacity):
+        """Grow the file and mapping to capacity. Lock must be held by caller."""
+        try:
+            # Extends the file and the existing mapping in place.
+            self._m.resize(capacity)
+        except (OSError, SystemError):
+            # Platforms without mremap() can't resize a mapping, so map the
+            # file again instead.
+            self._f.truncate(capacity)
+            self._m = mmap.mmap(self._f.fileno(), capacity)
+        self._capacity = capacity
+
     def _read_all_values(self):
         """Yield (key, value, pos). No locking is performed."""
         return _read_all_values(data=self._m, used=self._used)
@@ -130,6 +149,19 @@ class MmapedDict:
         pos = self._positions[key]
         _pack_two_doubles(self._m, pos, value, timestamp)
 
+    def position(self, key):
+        """Return where the key's value is stored, initializing it if needed.
+
+        Entries never move within the file, so the position stays valid
+        for use with write_value_at() until the dict is closed.
+        """
+        if key not in self._positions:
+            self._init_value(key)
+        return self._positions[key]
+
+    def write_value_at(self, pos, value, timestamp):
+        _pack_two_doubles(self._m, pos, value, timestamp)
+
     def close(self):
         if self._f:
             self._m.close()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+import functools
 
 from ..utils import floatToGoString
 from ..validation import (
@@ -20,17 +21,24 @@ def _is_valid_exemplar_metric(metric, sample):
     return False
 
 
+@functools.lru_cache(maxsize=4096)
+def _metadata(name, documentation, typ, unit):
+    """Returns the HELP, TYPE and UNIT lines for a metric family.
+
+    These don't change between scrapes, so the result is cached."""
+    name = escape_metric_name(name)
+    metadata = f'# HELP {name} {_escape(documentation)}\n# TYPE {name} {typ}\n'
+    if unit:
+        metadata += f'# UNIT {name} {unit}\n'
+    return metadata
+
+
 def generate_latest(registry):
     '''Returns the metrics from the registry in latest text format as a string.'''
     output = []
     for metric in registry.collect():
         try:
-            mname = metric.name
-            output.append('# HELP {} {}\n'.format(
-                escape_metric_name(mname), _escape(metric.documentation)))
-            output.append(f'# TYPE {escape_metric_name(mname)} {metric.type}\n')
-            if metric.unit:
-                output.append(f'# UNIT {escape_metric_name(mname)} {metric.unit}\n')
+            output.append(_metadata(metric.name, metric.documentation, metric.type, metric.unit))
             for s in metric.samples:
                 if not _is_valid_legacy_metric_name(s.name):
                     labelstr = escape_metric_name(s.name)
@@ -114,4 +122,9 @@ def escape_label_name(s: str) -> str:
 
 def _escape(s: str) -> str:
     """Performs backslash escaping on backslash, newline, and double-quote characters."""
+    if type(s) is str and '\\' not in s and '\n' not in s and '"' not in s:
+        # Most values have nothing to escape, and checking is cheaper than
+        # three copying replaces. Anything other than a str falls through, so
+        # it fails the same way it always has.
+        return s
     return s.replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
@@ -1,5 +1,5 @@
 import os
-from typing import Callable, Iterable, Optional, Union
+from typing import Callable, Iterable, Optional, Tuple, Union
 
 from .metrics_core import CounterMetricFamily, GaugeMetricFamily, Metric
 from .registry import Collector, CollectorRegistry, REGISTRY
@@ -35,6 +35,8 @@ class ProcessCollector(Collector):
             pass
 
         self._pagesize = _PAGESIZE
+        # The pid, followed by the paths read for it on each scrape.
+        self._paths: Optional[Tuple[str, str, str, str]] = None
 
         # This is used to test if we can access /proc.
         self._btime = 0
@@ -55,12 +57,26 @@ class ProcessCollector(Collector):
         if not self._btime:
             return []
 
-        pid = os.path.join(self._proc, str(self._pid()).strip())
+        pid = str(self._pid()).strip()
+        paths = self._paths
+        if paths is None or paths[0] != pid:
+            # The pid rarely changes, so only rebuild the paths when it does.
+            piddir = os.path.join(self._proc, pid)
+            paths = self._paths = (
+                pid,
+                os.path.join(piddir, 'stat'),
+                os.path.join(piddir, 'limits'),
+                os.path.join(piddir, 'fd'),
+            )
+        _, stat_path, limits_path, fd_path = paths
 
         result = []
         try:
-            with open(os.path.join(pid, 'stat'), 'rb') as stat:
-                parts = (stat.read().split(b')')[-1].split())
+            with open(stat_path, 'rb') as stat:
+                data = stat.read()
+            # The command name can contain anything, including ')', so the
+            # fields start after the last one. Only the first 22 are used.
+            parts = data[data.rfind(b')') + 1:].split(None, 22)
 
             vmem = GaugeMetricFamily(self._prefix + 'virtual_memory_bytes',
                                      'Virtual memory size in bytes.', value=float(parts[20]))
@@ -80,7 +96,7 @@ class ProcessCollector(Collector):
             pass
 
         try:
-            with open(os.path.join(pid, 'limits'), 'rb') as limits:
+            with open(limits_path, 'rb') as limits:
                 for line in limits:
                     if line.startswith(b'Max open file'):
                         max_fds = GaugeMetricFamily(self._prefix + 'max_fds',
@@ -89,7 +105,7 @@ class ProcessCollector(Collector):
                         break
             open_fds = GaugeMetricFamily(self._prefix + 'open_fds',
                                          'Number of open file descriptors.',
-                                         len(os.listdir(os.path.join(pid, 'fd'))))
+                                         len(os.listdir(fd_path)))
             result.extend([open_fds, max_fds])
         except OSError:
             pass
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-import copy
+from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .metrics_core import Metric
 
@@ -18,18 +18,33 @@ class _EmptyCollector(Collector):
         return []
 
 
+def _collect_all(collector: Collector) -> List[Metric]:
+    return list(collector.collect())
+
+
 class CollectorRegistry(Collector):
     """Metric collector registry.
 
     Collectors must have a no-argument method 'collect' that returns a list of
     Metric objects. The returned metrics should be consistent with the Prometheus
     exposition formats.
+
+    If parallel is True, collect() runs the collectors concurrently in a thread
+    pool, which shortens scrapes when several collectors block on I/O. Only
+    enable it if all the registered collectors are safe to call from another
+    thread. Metrics are still returned in registration order.
     """
 
-    def __init__(self, auto_describe: bool = False, target_info: Optional[Dict[str, str]] = None):
+    def __init__(self, auto_describe: bool = False, target_info: Optional[Dict[str, str]] = None,
+                 parallel: bool = False):
         self._collector_to_names: Dict[Collector, List[str]] = {}
         self._names_to_collectors: Dict[str, Collector] = {}
+        # Replaced, never mutated, on (un)registration so that collect()
+        # can iterate it without copying or locking.
+        self._collectors: Tuple[Collector, ...] = ()
         self._auto_describe = auto_describe
+        self._parallel = parallel
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._lock = Lock()
         self._target_info: Optional[Dict[str, str]] = {}
         self.set_target_info(target_info)
@@ -46,6 +61,7 @@ class CollectorRegistry(Collector):
             for name in names:
                 self._names_to_collectors[name] = collector
             self._collector_to_names[collector] = names
+            self._collectors += (collector,)
 
     def unregister(self, collector: Collector) -> None:
         """Remove a collector from the registry."""
@@ -53,6 +69,7 @@ class CollectorRegistry(Collector):
             for name in self._collector_to_names[collector]:
                 del self._names_to_collectors[name]
             del self._collector_to_names[collector]
+            self._collectors = tuple(c for c in self._collectors if c is not collector)
 
     def _get_names(self, collector):
         """Get names of timeseries the collector produces and clashes with."""
@@ -85,16 +102,26 @@ class CollectorRegistry(Collector):
 
     def collect(self) -> Iterable[Metric]:
         """Yields metrics from the collectors in the registry."""
-        collectors = None
-        ti = None
+        collectors = self._collectors
+        target_info = self._target_info
+        if target_info:
+            yield self._target_info_metric(target_info)
+        if self._parallel and len(collectors) > 1:
+            executor = self._get_executor()
+            # Collectors may return lazy iterables, so consume them in the
+            # pool for the work to actually happen there.
+            futures = [executor.submit(_collect_all, c) for c in collectors]
+            for future in futures:
+                yield from future.result()
+        else:
+            for collector in collectors:
+                yield from collector.collect()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
         with self._lock:
-            collectors = copy.copy(self._collector_to_names)
-            if self._target_info:
-                ti = self._target_info_metric()
-        if ti:
-            yield ti
-        for collector in collectors:
-            yield from collector.collect()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix='prometheus_collect')
+            return self._executor
 
     def restricted_registry(self, names: Iterable[str]) -> "RestrictedRegistry":
         """Returns object that only collects some metrics.
@@ -123,9 +150,9 @@ class CollectorRegistry(Collector):
         with self._lock:
             return self._target_info
 
-    def _target_info_metric(self):
+    def _target_info_metric(self, labels):
         m = Metric('target', 'Target metadata', 'info')
-        m.add_sample('target_info', self._target_info, 1)
+        m.add_sample('target_info', labels, 1)
         return m
 
     def get_sample_value(self, name: str, labels: Optional[Dict[str, str]] = None) -> Optional[float]:
@@ -149,15 +176,17 @@ class RestrictedRegistry:
 
     def collect(self) -> Iterable[Metric]:
         collectors = set()
-        target_info_metric = None
-        with self._registry._lock:
-            if 'target_info' in self._name_set and self._registry._target_info:
-                target_info_metric = self._registry._target_info_metric()
-            for name in self._name_set:
-                if name != 'target_info' and name in self._registry._names_to_collectors:
-                    collectors.add(self._registry._names_to_collectors[name])
-        if target_info_metric:
-            yield target_info_metric
+        # Like CollectorRegistry.collect, don't hold the registry lock for
+        # the scrape. Single dict lookups and attribute reads are atomic.
+        names_to_collectors = self._registry._names_to_collectors
+        target_info = self._registry._target_info
+        for name in self._name_set:
+            if name != 'target_info':
+                collector = names_to_collectors.get(name)
+                if collector is not None:
+                    collectors.add(collector)
+        if 'target_info' in self._name_set and target_info:
+            yield self._registry._target_info_metric(target_info)
         for collector in collectors:
             for metric in collector.collect():
                 m = metric._restricted_metric(self._name_set)
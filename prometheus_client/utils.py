@@ -6,7 +6,12 @@ NaN = float("NaN")
 
 
 def floatToGoString(d):
-    d = float(d)
+    if type(d) is not float:
+        d = float(d)
+    if -1e6 < d < 1e6:
+        # Fast path for the common case: finite, and too small for Go to
+        # switch to exponent notation, so Python's repr is already correct.
+        return repr(d)
     if d == INF:
         return '+Inf'
     elif d == MINUS_INF:
@@ -6,6 +6,27 @@ METRIC_LABEL_NAME_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
 RESERVED_METRIC_LABEL_NAME_RE = re.compile(r'^__.*$')
 
 
+def _matches_metric_name_re(name: str) -> bool:
+    """Returns whether METRIC_NAME_RE matches the name.
+
+    ASCII identifiers, with colons allowed, are the common case and are much
+    cheaper to check with str methods than with the regex."""
+    if name.isascii() and name.replace(':', '_').isidentifier():
+        return True
+    return METRIC_NAME_RE.match(name) is not None
+
+
+def _matches_label_name_re(name: str) -> bool:
+    """Returns whether METRIC_LABEL_NAME_RE matches the name."""
+    if name.isascii() and name.isidentifier():
+        return True
+    return METRIC_LABEL_NAME_RE.match(name) is not None
+
+
+def _is_reserved_labelname(name: str) -> bool:
+    return name.startswith('__') and RESERVED_METRIC_LABEL_NAME_RE.match(name) is not None
+
+
 def _init_legacy_validation() -> bool:
     """Retrieve name validation setting from environment."""
     return os.environ.get("PROMETHEUS_LEGACY_NAME_VALIDATION", 'False').lower() in ('true', '1', 't')
@@ -41,7 +62,7 @@ def _validate_metric_name(name: str) -> None:
         raise ValueError("metric name cannot be empty")
     global _legacy_validation
     if _legacy_validation:
-        if not METRIC_NAME_RE.match(name):
+        if not _matches_metric_name_re(name):
             raise ValueError("invalid metric name " + name)
     try:
         name.encode('utf-8')
@@ -51,7 +72,7 @@ def _validate_metric_name(name: str) -> None:
 
 def _is_valid_legacy_metric_name(name: str) -> bool:
     """Returns true if the provided metric name conforms to the legacy validation scheme."""
-    return METRIC_NAME_RE.match(name) is not None
+    return _matches_metric_name_re(name)
 
 
 def _validate_metric_label_name_token(tok: str) -> None:
@@ -64,7 +85,7 @@ def _validate_metric_label_name_token(tok: str) -> None:
     global _legacy_validation
     quoted = tok[0] == '"' and tok[-1] == '"'
     if not quoted or _legacy_validation:
-        if not METRIC_LABEL_NAME_RE.match(tok):
+        if not _matches_label_name_re(tok):
             raise ValueError("invalid label name token " + tok)
         return
     try:
@@ -79,24 +100,24 @@ def _validate_labelname(l):
     This check uses the global legacy validation setting to determine the validation scheme.
     """
     if get_legacy_validation():
-        if not METRIC_LABEL_NAME_RE.match(l):
+        if not _matches_label_name_re(l):
             raise ValueError('Invalid label metric name: ' + l)
-        if RESERVED_METRIC_LABEL_NAME_RE.match(l):
+        if _is_reserved_labelname(l):
             raise ValueError('Reserved label metric name: ' + l)
     else:
         try:
             l.encode('utf-8')
         except UnicodeDecodeError:
             raise ValueError('Invalid label metric name: ' + l)
-        if RESERVED_METRIC_LABEL_NAME_RE.match(l):
+        if _is_reserved_labelname(l):
             raise ValueError('Reserved label metric name: ' + l)
         
 
 def _is_valid_legacy_labelname(l: str) -> bool:
     """Returns true if the provided label name conforms to the legacy validation scheme."""
-    if METRIC_LABEL_NAME_RE.match(l) is None:
+    if not _matches_label_name_re(l):
         return False
-    return RESERVED_METRIC_LABEL_NAME_RE.match(l) is None
+    return not _is_reserved_labelname(l)
 
 
 def _validate_labelnames(cls, labelnames):
@@ -8,6 +8,10 @@ from .mmap_dict import mmap_key, MmapedDict
 class MutexValue:
     """A float protected by a mutex."""
 
+    # There is one of these for every child, and one per bucket for
+    # histograms, so leave out the per-instance __dict__.
+    __slots__ = ('_value', '_exemplar', '_lock')
+
     _multiprocess = False
 
     def __init__(self, typ, metric_name, name, labelnames, labelvalues, help_text, **kwargs):
@@ -28,12 +32,12 @@ class MutexValue:
             self._exemplar = exemplar
 
     def get(self):
-        with self._lock:
-            return self._value
+        # Reading a single attribute is atomic, so readers such as scrapes
+        # don't need to contend with writers for the lock.
+        return self._value
 
     def get_exemplar(self):
-        with self._lock:
-            return self._exemplar
+        return self._exemplar
 
 
 def MultiProcessValue(process_identifier=os.getpid):
@@ -55,10 +59,17 @@ def MultiProcessValue(process_identifier=os.getpid):
     class MmapedValue:
         """A float protected by a mutex backed by a per-process mmaped file."""
 
+        __slots__ = ('_file_prefix', '_file', '_key', '_pos', '_value', '_timestamp')
+
         _multiprocess = True
 
         def __init__(self, typ, metric_name, name, labelnames, labelvalues, help_text, multiprocess_mode='', **kwargs):
-            self._params = typ, metric_name, name, labelnames, labelvalues, help_text, multiprocess_mode
+            if typ == 'gauge':
+                self._file_prefix = typ + '_' + multiprocess_mode
+            else:
+                self._file_prefix = typ
+            # The key doesn't change across forks, so only encode it once.
+            self._key = mmap_key(metric_name, name, labelnames, labelvalues, help_text)
             # This deprecation warning can go away in a few releases when removing the compatibility
             if 'prometheus_multiproc_dir' in os.environ and 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
                 os.environ['PROMETHEUS_MULTIPROC_DIR'] = os.environ['prometheus_multiproc_dir']
@@ -69,11 +80,7 @@ def MultiProcessValue(process_identifier=os.getpid):
                 values.append(self)
 
         def __reset(self):
-            typ, metric_name, name, labelnames, labelvalues, help_text, multiprocess_mode = self._params
-            if typ == 'gauge':
-                file_prefix = typ + '_' + multiprocess_mode
-            else:
-                file_prefix = typ
+            file_prefix = self._file_prefix
             if file_prefix not in files:
                 filename = os.path.join(
                     os.environ.get('PROMETHEUS_MULTIPROC_DIR'),
@@ -81,8 +88,9 @@ def MultiProcessValue(process_identifier=os.getpid):
 
                 files[file_prefix] = MmapedDict(filename)
             self._file = files[file_prefix]
-            self._key = mmap_key(metric_name, name, labelnames, labelvalues, help_text)
             self._value, self._timestamp = self._file.read_value(self._key)
+            # Resolve the key once so updates don't look it up each time.
+            self._pos = self._file.position(self._key)
 
         def __check_for_pid_change(self):
             actual_pid = process_identifier()
@@ -100,23 +108,26 @@ def MultiProcessValue(process_identifier=os.getpid):
                 self.__check_for_pid_change()
                 self._value += amount
                 self._timestamp = 0.0
-                self._file.write_value(self._key, self._value, self._timestamp)
+                self._file.write_value_at(self._pos, self._value, self._timestamp)
 
         def set(self, value, timestamp=None):
             with lock:
                 self.__check_for_pid_change()
                 self._value = value
                 self._timestamp = timestamp or 0.0
-                self._file.write_value(self._key, self._value, self._timestamp)
+                self._file.write_value_at(self._pos, self._value, self._timestamp)
 
         def set_exemplar(self, exemplar):
             # TODO: Implement exemplars for multiprocess mode.
             return
 
         def get(self):
-            with lock:
-                self.__check_for_pid_change()
-                return self._value
+            # Reading the cached value is atomic, so scrapes only need the
+            # lock when the process has forked and the values must be reset.
+            if pid['value'] != process_identifier():
+                with lock:
+                    self.__check_for_pid_change()
+            return self._value
 
         def get_exemplar(self):
             # TODO: Implement exemplars for multiprocess mode.
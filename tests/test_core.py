@@ -1,5 +1,6 @@
 from concurrent.futures import ThreadPoolExecutor
 import os
+import threading
 import time
 import unittest
 
@@ -435,6 +436,28 @@ class TestHistogram(unittest.TestCase):
         """.observe() must fail if the Summary is not observable."""
         assert_not_observable(self.labels.observe, 1)
 
+    def test_histogram_observe_many(self):
+        self.histogram.observe_many([2, 2.5, 0.001, float("inf")])
+        self.assertEqual(1, self.registry.get_sample_value('h_bucket', {'le': '0.005'}))
+        self.assertEqual(1, self.registry.get_sample_value('h_bucket', {'le': '1.0'}))
+        self.assertEqual(3, self.registry.get_sample_value('h_bucket', {'le': '2.5'}))
+        self.assertEqual(4, self.registry.get_sample_value('h_bucket', {'le': '+Inf'}))
+        self.assertEqual(4, self.registry.get_sample_value('h_count'))
+        self.assertEqual(float("inf"), self.registry.get_sample_value('h_sum'))
+
+        self.labels.labels('a').observe_many(x / 10 for x in range(10))
+        self.assertEqual(10, self.registry.get_sample_value('hl_bucket', {'le': '1.0', 'l': 'a'}))
+        self.assertEqual(10, self.registry.get_sample_value('hl_count', {'l': 'a'}))
+        self.assertAlmostEqual(4.5, self.registry.get_sample_value('hl_sum', {'l': 'a'}))
+
+        assert_not_observable(self.labels.observe_many, [1])
+
+    def test_histogram_nan(self):
+        self.histogram.observe(float("nan"))
+        self.assertEqual(0, self.registry.get_sample_value('h_bucket', {'le': '0.005'}))
+        self.assertEqual(0, self.registry.get_sample_value('h_bucket', {'le': '+Inf'}))
+        self.assertEqual(0, self.registry.get_sample_value('h_count'))
+
     def test_setting_buckets(self):
         h = Histogram('h', 'help', registry=None, buckets=[0, 1, 2])
         self.assertEqual([0.0, 1.0, 2.0, float("inf")], h._upper_bounds)
@@ -659,6 +682,10 @@ class TestMetricWrapper(unittest.TestCase):
         self.assertRaises(ValueError, self.two_labels.labels)
         self.assertRaises(ValueError, self.two_labels.labels, {'a': 'x'}, b='y')
 
+    def test_labels_by_kwarg_duplicate_labelnames(self):
+        c = Counter('dup', 'help', labelnames=['a', 'a'], registry=None)
+        self.assertRaises(ValueError, c.labels, a='x')
+
     def test_invalid_legacy_names_raise(self):
         enable_legacy_validation()
         self.assertRaises(ValueError, Counter, '', 'help')
@@ -795,6 +822,12 @@ class TestMetricFamilies(unittest.TestCase):
         self.assertEqual(2, self.registry.get_sample_value('h_count', {'a': 'b'}))
         self.assertEqual(3, self.registry.get_sample_value('h_sum', {'a': 'b'}))
 
+    def test_histogram_labels_not_shared(self):
+        cmf = HistogramMetricFamily('h', 'help', labels=['a'])
+        cmf.add_metric(['b'], buckets=[('0', 1), ('+Inf', 2)], sum_value=3)
+        labels = [s.labels for s in cmf.samples]
+        self.assertEqual(len(labels), len({id(lbl) for lbl in labels}))
+
     def test_gaugehistogram(self):
         self.custom_collector(GaugeHistogramMetricFamily('h', 'help', buckets=[('0', 1), ('+Inf', 2)]))
         self.assertEqual(1, self.registry.get_sample_value('h_bucket', {'le': '0'}))
@@ -915,6 +948,37 @@ class TestCollectorRegistry(unittest.TestCase):
         registry.unregister(s)
         Gauge('s_count', 'help', registry=registry)
 
+    def test_unregister_during_collect(self):
+        registry = CollectorRegistry()
+        a = Gauge('a', 'help', registry=registry)
+        b = Gauge('b', 'help', registry=registry)
+        metrics = registry.collect()
+        self.assertEqual('a', next(metrics).name)
+        registry.unregister(b)
+        Gauge('c', 'help', registry=registry)
+        self.assertEqual(['b'], [m.name for m in metrics])
+        self.assertEqual(['a', 'c'], [m.name for m in registry.collect()])
+        registry.unregister(a)
+        self.assertEqual(['c'], [m.name for m in registry.collect()])
+
+    def test_parallel_collect(self):
+        registry = CollectorRegistry(parallel=True)
+        barrier = threading.Barrier(2, timeout=5)
+
+        class BlockingCollector:
+            def __init__(self, name):
+                self.name = name
+
+            def collect(self):
+                # Only returns if the other collector runs at the same time.
+                barrier.wait()
+                yield GaugeMetricFamily(self.name, 'help', value=1)
+
+        registry.register(BlockingCollector('a'))
+        registry.register(BlockingCollector('b'))
+        Gauge('c', 'help', registry=registry)
+        self.assertEqual(['a', 'b', 'c'], [m.name for m in registry.collect()])
+
     def custom_collector(self, metric_family, registry):
         class CustomCollector:
             def collect(self):
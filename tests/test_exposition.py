@@ -1,5 +1,6 @@
 from http.server import BaseHTTPRequestHandler, HTTPServer
 import os
+import tempfile
 import threading
 import time
 import unittest
@@ -9,7 +10,7 @@ import pytest
 from prometheus_client import (
     CollectorRegistry, CONTENT_TYPE_LATEST, core, Counter, delete_from_gateway,
     Enum, Gauge, generate_latest, Histogram, Info, instance_ip_grouping_key,
-    Metric, push_to_gateway, pushadd_to_gateway, Summary,
+    Metric, push_to_gateway, pushadd_to_gateway, Summary, write_to_textfile,
 )
 from prometheus_client.core import GaugeHistogramMetricFamily, Timestamp
 from prometheus_client.exposition import (
@@ -17,6 +18,7 @@ from prometheus_client.exposition import (
     passthrough_redirect_handler, tls_auth_handler,
 )
 import prometheus_client.openmetrics.exposition as openmetrics
+from prometheus_client.utils import floatToGoString
 
 
 class TestGenerateText(unittest.TestCase):
@@ -205,6 +207,30 @@ ts{foo="e"} 0.0 123000
 ts{foo="f"} 0.0 123000
 """, generate_latest(self.registry))
 
+    def test_write_to_textfile(self):
+        c = Counter('cc', 'A counter', registry=self.registry)
+        c.inc()
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'metrics.prom')
+            write_to_textfile(path, self.registry)
+            with open(path, 'rb') as f:
+                self.assertEqual(generate_latest(self.registry), f.read())
+
+    def test_write_to_textfile_failing_collector(self):
+        c = Counter('cc', 'A counter', registry=self.registry)
+        c.inc()
+
+        class FailingCollector:
+            def collect(self):
+                raise ValueError('broken')
+
+        self.registry.register(FailingCollector())
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'metrics.prom')
+            with self.assertRaises(ValueError):
+                write_to_textfile(path, self.registry)
+            self.assertEqual([], os.listdir(d))
+
 
 class TestPushGateway(unittest.TestCase):
     def setUp(self):
@@ -490,5 +516,23 @@ def test_choose_encoder():
     assert choose_encoder(openmetrics.CONTENT_TYPE_LATEST) == (openmetrics.generate_latest, openmetrics.CONTENT_TYPE_LATEST)
 
 
+@pytest.mark.parametrize('value,expected', [
+    (17, '17.0'),
+    (0.005, '0.005'),
+    (-0.0, '-0.0'),
+    (999999.0, '999999.0'),
+    (-999999.5, '-999999.5'),
+    (1e6, '1e+06'),
+    (1234567.0, '1.234567e+06'),
+    (-1e6, '-1000000.0'),
+    (1e20, '1e+20'),
+    (float('inf'), '+Inf'),
+    (float('-inf'), '-Inf'),
+    (float('nan'), 'NaN'),
+])
+def test_float_to_go_string(value, expected):
+    assert floatToGoString(value) == expected
+
+
 if __name__ == '__main__':
     unittest.main()
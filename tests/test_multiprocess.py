@@ -222,6 +222,16 @@ class TestMultiProcess(unittest.TestCase):
         self.assertEqual(3, self.registry.get_sample_value('c_total'))
         self.assertEqual(1, c1._value.get())
 
+    def test_get_detects_pid_change(self):
+        pid = 0
+        values.ValueClass = MultiProcessValue(lambda: pid)
+        c1 = Counter('c', 'help', registry=None)
+        c1.inc(2)
+        self.assertEqual(2, c1._value.get())
+        pid = 1
+        self.assertEqual(0, c1._value.get())
+        self.assertEqual(2, self.registry.get_sample_value('c_total'))
+
     def test_initialization_detects_pid_change(self):
         pid = 0
         values.ValueClass = MultiProcessValue(lambda: pid)
@@ -425,6 +435,23 @@ class TestMmapedDict(unittest.TestCase):
             [('abc', 42.0, 987.0), (key, 123.0, 876.0), ('def', 17.0, 765.0)],
             list(self.d.read_all_values()))
 
+    def test_expansion_grows_file(self):
+        key = 'a' * mmap_dict._INITIAL_MMAP_SIZE
+        self.d.write_value('abc', 42.0, 987.0)
+        self.d.write_value(key, 123.0, 876.0)
+        self.assertEqual(mmap_dict._INITIAL_MMAP_SIZE * 2, os.path.getsize(self.tempfile))
+        values = mmap_dict.MmapedDict.read_all_values_from_file(self.tempfile)
+        self.assertEqual(
+            [('abc', 42.0, 987.0), (key, 123.0, 876.0)],
+            [(k, v, ts) for k, v, ts, _ in values])
+
+    def test_write_value_at_position(self):
+        pos = self.d.position('abc')
+        self.d.write_value('def', 17.0, 765.0)
+        self.d.write_value_at(pos, 42.0, 987.0)
+        self.assertEqual(pos, self.d.position('abc'))
+        self.assertEqual((42.0, 987.0), self.d.read_value('abc'))
+
     def test_corruption_detected(self):
         self.d.write_value('abc', 42.0, 987.0)
         # corrupt the written data
@@ -60,6 +60,16 @@ class TestProcessCollector(unittest.TestCase):
         self.assertEqual(None, self.registry.get_sample_value('process_open_fds'))
         self.assertEqual(None, self.registry.get_sample_value('process_fake_namespace'))
 
+    def test_pid_change(self):
+        pids = [26231, 584]
+        collector = ProcessCollector(proc=self.test_proc, pid=lambda: pids[0], registry=self.registry)
+        collector._ticks = 100
+        collector._pagesize = 4096
+
+        self.assertEqual(56274944.0, self.registry.get_sample_value('process_virtual_memory_bytes'))
+        pids.pop(0)
+        self.assertEqual(10395648.0, self.registry.get_sample_value('process_virtual_memory_bytes'))
+
 
 if __name__ == '__main__':
     unittest.main()